@@ -1,44 +1,73 @@
+import itertools
 import os
 import re
 
+_WORD_RE = re.compile(r'[A-Za-z]+')
+_ENGLISH_WORDS = frozenset({'english', 'eng', 'en'})
+_VIDEO_EXTS = frozenset({'avi', 'mkv', 'mp4'})
+_SUBTITLE_EXTS = frozenset({'sub', 'idx', 'srt', 'smi', 'ssa', 'ass', 'vtt'})
+_RANKS = (80, 100, 80, 90)  # Indexed by english | (sdh << 1)
+
 
 def is_video(filename):
-    return parse_extension(filename) in ['avi', 'mkv', 'mp4']
+    return parse_extension(filename) in _VIDEO_EXTS
 
 
 def is_subtitle(filename):
-    return parse_extension(filename) in ['sub', 'idx', 'srt', 'smi', 'ssa', 'ass', 'vtt']
+    return parse_extension(filename) in _SUBTITLE_EXTS
 
 
 def parse_extension(filename):
-    return os.path.splitext(filename)[1][1:]
+    head, sep, ext = filename.rpartition('.')
+    if not sep:
+        return ''
+    return ext.lower()
 
 
 def forward_main_videos(torrent):
-    videos = [file for file in torrent.files().values() if is_video(file['name'])]
-    videos_by_size = sorted(videos, key=lambda v: v['size'], reverse=True)
-    if len(videos_by_size) > 0:
-        main_video = videos_by_size[0]
-        main_filename = main_video['name']
-        return [{'download_dir': torrent.downloadDir, 'filename': main_filename, 'dest': main_filename}]
-    else:
-        return []
+    videos, _ = _classify_files(torrent)
+    return _main_video(videos)
 
 
 def forward_subtitles(torrent):
-    mappings = []
+    _, subtitles = _classify_files(torrent)
+    return subtitles
+
+
+def _classify_files(torrent):
+    videos = []
+    subtitles = []
     for file in torrent.files().values():
         filename = file['name']
-        if is_subtitle(filename):
-            rule = {'download_dir': torrent.downloadDir, 'filename': filename, 'dest': filename}
-            mappings.append(rule)
-    return mappings
+        rule = _annotate({'download_dir': torrent.downloadDir, 'filename': filename, 'dest': filename})
+        if rule['_ext'] in _VIDEO_EXTS:
+            rule['_size'] = file['size']
+            videos.append(rule)
+        elif rule['_ext'] in _SUBTITLE_EXTS:
+            subtitles.append(rule)
+    return videos, subtitles
+
+
+def _main_video(videos):
+    if not videos:
+        return []
+    return [max(videos, key=lambda v: v['_size'])]
+
+
+def _annotate(rule):
+    directory, base = os.path.split(rule['filename'])
+    rule['_dir'] = directory
+    rule['_base'] = base
+    rule['_ext'] = parse_extension(base)
+    return rule
 
 
 def sidecar_subtitle(main_video, subtitles):
-    if len(main_video) <= 0:
+    if not main_video:
         return []
-    video_dir = os.path.dirname(main_video[0]['filename'])
+    if not subtitles:
+        return []
+    video_dir = main_video[0]['_dir']
     if has_sidecar(subtitles, video_dir):
         return []
     elif has_vobsub(subtitles):
@@ -49,88 +78,74 @@ def sidecar_subtitle(main_video, subtitles):
 
 def has_sidecar(subtitles, video_dir):
     for sub in subtitles:
-        if os.path.dirname(sub['filename']) == video_dir:
+        if sub['_dir'] == video_dir:
             return True
     return False
 
 
 def sidecar_best_non_vobsub(subtitles, video_dir):
-    subs = list(subtitles)
-    for sub in subs:
-        sub['rank'] = rank_subtitle(sub)
-    ranked_subs = sorted(subs, key=lambda s: s['rank'], reverse=True)
-    if len(ranked_subs) <= 0:
+    if not subtitles:
         return []
-    best_sub = ranked_subs[0]
-    filename = best_sub['filename']
-    basename = os.path.basename(filename)
+    best_sub = max(subtitles, key=rank_subtitle)
     rule = {'download_dir': best_sub['download_dir'],
-            'filename': filename,
-            'dest': video_dir + '/' + basename}
+            'filename': best_sub['filename'],
+            'dest': os.path.join(video_dir, best_sub['_base'])}
     return [rule]
 
 
 def rank_subtitle(subtitle):
-    name = os.path.basename(subtitle['filename'])
-    if is_english_subtitle(name):
-        if is_sdh_subtitle(name):
-            return 90
-        else:
-            return 100
-    else:
-        return 80
+    tokens = tokenize(subtitle['_base'])
+    english = int(not tokens.isdisjoint(_ENGLISH_WORDS))
+    sdh = int('sdh' in tokens)
+    return _RANKS[english | (sdh << 1)]
 
 
 def is_english_subtitle(name):
-    return contains_any_word_ignoring_case(name, ['english', 'eng', 'en'])
+    return not tokenize(name).isdisjoint(_ENGLISH_WORDS)
 
 
 def is_sdh_subtitle(name):
-    return contains_any_word_ignoring_case(name, ['sdh'])
+    return 'sdh' in tokenize(name)
 
 
-def contains_any_word_ignoring_case(line, words):
-    pattern = re.compile(r'\b(' + '|'.join(words) + r')\b', re.IGNORECASE)
-    return pattern.match(line) is not None
+def tokenize(name):
+    return {word.lower() for word in _WORD_RE.findall(name)}
 
 
 def has_vobsub(subtitles):
     has_idx = False
     has_sub = False
     for sub in subtitles:
-        ext = os.path.splitext(sub['filename'])[1][1:]
+        ext = sub['_ext']
         if ext == 'idx':
             has_idx = True
-        if ext == 'sub':
+        elif ext == 'sub':
             has_sub = True
-    return has_idx and has_sub
+        if has_idx and has_sub:
+            return True
+    return False
 
 
 def sidecar_vobsub(subtitles, video_dir):
     mappings = []
     for sub in subtitles:
-        filename = sub['filename']
-        ext = os.path.splitext(filename)[1][1:]
-        basename = os.path.basename(filename)
-        if ext in ['idx', 'sub']:
+        if sub['_ext'] in ['idx', 'sub']:
             rule = {'download_dir': sub['download_dir'],
-                    'filename': filename,
-                    'dest': video_dir + '/' + basename}
+                    'filename': sub['filename'],
+                    'dest': os.path.join(video_dir, sub['_base'])}
             mappings.append(rule)
     return mappings
 
 
 def move_to_dir(folder, files):
-    mappings = []
-    for f in files:
-        rule = {'download_dir': f['download_dir'], 'filename': f['filename'], 'dest': folder + f['dest']}
-        mappings.append(rule)
-    return mappings
+    return [{'download_dir': f['download_dir'],
+             'filename': f['filename'],
+             'dest': os.path.join(folder, f['dest'])} for f in files]
 
 
 def map_single_video_download_with_subs(torrent, dest_dir):
-    main_video = forward_main_videos(torrent)
-    subtitles = forward_subtitles(torrent)
+    videos, subtitles = _classify_files(torrent)
+    main_video = _main_video(videos)
     sidecar_subs = sidecar_subtitle(main_video, subtitles)
-    files = main_video + subtitles + sidecar_subs
+    files = itertools.chain(main_video, subtitles, sidecar_subs)
     return move_to_dir(dest_dir, files)
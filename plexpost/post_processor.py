@@ -2,7 +2,7 @@ import os
 
 
 def path_traversals(path):
-    dirs = [d for d in path.split('/') if len(d) > 0]
+    dirs = [d for d in path.split('/') if d]
     paths = []
     for idx in range(0, len(dirs)):
         paths.append('/'.join(dirs[0:idx + 1]))  # List all paths with at least 1 directory
@@ -61,7 +61,7 @@ class PostProcessor:
         for t in torrents:
             print('  ' + t.name)
             mappings.extend(self.media_processor.map_files(t))
-        if len(torrents) > 0:
+        if torrents:
             print('Waking htpc')
             self.htpc.turn_on()
         self.transfer_to_htpc(mappings)
@@ -77,7 +77,7 @@ class PostProcessor:
         return torrents
 
     def transfer_to_htpc(self, mappings):
-        if len(mappings) == 0:
+        if not mappings:
             return
         with self.sftp_factory.await_connection() as sftp:
             for rule in mappings:
@@ -90,7 +90,7 @@ class PostProcessor:
                 dest_file = rule['dest']
                 print('Transferring ' + file + ' to remote')
                 remote_dir = os.path.dirname(dest_file)
-                if len(remote_dir) > 0:
+                if remote_dir:
                     sftp.makedirs(remote_dir)
                 sftp.put(src_file, dest_file)
                 print('Completed transferring ' + file)
@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+
+def touch(prefix, file):
+    path = os.path.join(prefix, file)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    Path(path).touch()
+    return file
+
+
+def touch_all(prefix, files):
+    paths = [os.path.join(prefix, file) for file in files]
+    for directory in {os.path.dirname(path) for path in paths}:
+        os.makedirs(directory, exist_ok=True)
+    for path in paths:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o644))
+    return files
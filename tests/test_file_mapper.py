@@ -1,9 +1,8 @@
-import errno
-import os
 from unittest.mock import Mock
 
 import pytest
 
+from _fsutil import touch_all
 from plexpost import post_processor, movies_flow
 from plexpost.sftp_factory import SFTPFactory
 
@@ -155,6 +154,21 @@ def test_should_consider_only_complete_words_when_finding_language_in_subtitle_f
     assert not sftpclient.exists(remote_base_dir + '/movies/dir/engineer.srt')
 
 
+def test_should_detect_language_when_it_appears_in_the_middle_of_the_filename(completed_torrents,
+                                                                              automator,
+                                                                              sftpclient,
+                                                                              remote_base_dir,
+                                                                              download_dir):
+    main_video = 'dir/video.mkv'
+    eng_sub = 'dir/sub/Some.Movie.English.srt'
+    other_sub = 'dir/sub/Some.Movie.ch.srt'
+    files = [main_video, eng_sub, other_sub]
+    completed_torrents.return_value = [completed_torrent_with_data_files(download_dir, files)]
+    automator.run()
+    assert sftpclient.isfile(remote_base_dir + '/movies/dir/Some.Movie.English.srt')
+    assert not sftpclient.exists(remote_base_dir + '/movies/dir/Some.Movie.ch.srt')
+
+
 def completed_torrent_with_data_files(prefix, files):
     tor = Mock()
     tor.progress = 100
@@ -162,24 +176,11 @@ def completed_torrent_with_data_files(prefix, files):
     tor.downloadDir = prefix
     tor.name = 'Mock 1'
     data_files = {}
-    for idx, f in enumerate(files):
-        data_files[idx] = create_download_file(prefix, f)
+    for idx, f in enumerate(touch_all(prefix, files)):
+        data_files[idx] = create_download_file(f)
     tor.files.return_value = data_files
     return tor
 
 
-def create_download_file(prefix, filename):
-    return {'selected': True, 'priority': 'normal', 'size': 1, 'name': touch(prefix, filename), 'completed': 1}
-
-
-def touch(prefix, file):
-    path = prefix + '/' + file
-    if not os.path.exists(os.path.dirname(path)):
-        try:
-            os.makedirs(os.path.dirname(path))
-        except OSError as exc:  # Guard against race condition
-            if exc.errno != errno.EEXIST:
-                raise
-    with open(path, 'a'):
-        os.utime(path)
-    return file
+def create_download_file(filename):
+    return {'selected': True, 'priority': 'normal', 'size': 1, 'name': filename, 'completed': 1}
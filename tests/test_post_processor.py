@@ -1,10 +1,10 @@
-import errno
 import os
 from unittest.mock import Mock, call
 
 import pytest
 from transmissionrpc import Torrent
 
+from _fsutil import touch, touch_all
 from plexpost import post_processor, htpc_switch, default_flow
 from plexpost.sftp_factory import SFTPFactory
 
@@ -126,24 +126,11 @@ def completed_torrent_with_data_files(prefix, files):
     tor.downloadDir = prefix
     tor.name = 'Mock 1'
     data_files = {}
-    for idx, f in enumerate(files):
-        data_files[idx] = create_download_file(prefix, f)
+    for idx, f in enumerate(touch_all(prefix, files)):
+        data_files[idx] = create_download_file(f)
     tor.files.return_value = data_files
     return tor
 
 
-def create_download_file(prefix, filename):
-    return {'selected': True, 'priority': 'normal', 'size': 1, 'name': touch(prefix, filename), 'completed': 1}
-
-
-def touch(prefix, file):
-    path = prefix + '/' + file
-    if not os.path.exists(os.path.dirname(path)):
-        try:
-            os.makedirs(os.path.dirname(path))
-        except OSError as exc:  # Guard against race condition
-            if exc.errno != errno.EEXIST:
-                raise
-    with open(path, 'a'):
-        os.utime(path)
-    return file
+def create_download_file(filename):
+    return {'selected': True, 'priority': 'normal', 'size': 1, 'name': filename, 'completed': 1}